@@ -143,7 +143,7 @@ public partial class RhinoMCPFunctions
             {
                 foreach (var obj in created)
                 {
-                    obj.ExpireSolution(true);
+                    obj.ExpireSolution(false);
                 }
                 var solutionStopwatch = Stopwatch.StartNew();
                 RunGrasshopperSolution(doc, false);
@@ -298,7 +298,9 @@ public partial class RhinoMCPFunctions
 
         inputParam.AddSource(outputParam);
         EnsureParamHasData(outputParam);
-        targetObj.ExpireSolution(true);
+        // Only mark the target expired; GhBuildGraph solves once after every
+        // wire is in place instead of re-solving per connection.
+        targetObj.ExpireSolution(false);
     }
 
 }
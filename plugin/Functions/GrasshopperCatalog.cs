@@ -119,6 +119,7 @@ public partial class RhinoMCPFunctions
         string category = OptionalString(parameters, "category");
         bool includeDescription = OptionalBool(parameters, "include_description", false);
         int limit = Clamp(OptionalInt(parameters, "limit", 500), 1, 2000);
+        int offset = Math.Max(0, OptionalInt(parameters, "offset", 0));
 
         var filtered = FilterComponentProxies(null, category)
             .OrderBy(p => p.Desc.Category)
@@ -131,11 +132,14 @@ public partial class RhinoMCPFunctions
             .Distinct()
             .OrderBy(c => c);
 
-        var components = new JArray(filtered.Take(limit).Select(p => ComponentProxyToJson(p, includeDescription)));
+        var components = new JArray(filtered.Skip(offset).Take(limit).Select(p => ComponentProxyToJson(p, includeDescription)));
         return new JObject
         {
             ["count"] = components.Count,
             ["total_available"] = Instances.ComponentServer.ObjectProxies.Count(),
+            ["total_matching"] = filtered.Count,
+            ["offset"] = offset,
+            ["has_more"] = offset + components.Count < filtered.Count,
             ["category_filter"] = category,
             ["categories"] = new JArray(categories),
             ["components"] = components
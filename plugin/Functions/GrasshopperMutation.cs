@@ -165,7 +165,7 @@ public partial class RhinoMCPFunctions
                         }
                         inputParam.AddSource(outputParam);
                         EnsureParamHasData(outputParam);
-                        targetObj.ExpireSolution(true);
+                        targetObj.ExpireSolution(false);
                         addedConnections.Add(new GhConnectionRollback { Input = inputParam, Output = outputParam });
                         Touch(sourceObj);
                         Touch(targetObj);
@@ -275,7 +275,7 @@ public partial class RhinoMCPFunctions
                         {
                             removedConnections.Add(new GhDisconnectRollback { Input = inputParam, Sources = removed });
                         }
-                        targetObj.ExpireSolution(true);
+                        targetObj.ExpireSolution(false);
                         Touch(targetObj);
                         opResults.Add(new JObject
                         {
@@ -368,9 +368,11 @@ public partial class RhinoMCPFunctions
             long solutionDurationMs = 0;
             if (recompute || forceRecompute)
             {
+                // Expire everything first, then solve once: ExpireSolution(true)
+                // would start a new solution for every touched object.
                 foreach (var obj in touched.Where(o => !pendingDeletes.Contains(o)))
                 {
-                    obj.ExpireSolution(true);
+                    obj.ExpireSolution(false);
                 }
                 var solutionStopwatch = Stopwatch.StartNew();
                 RunGrasshopperSolution(doc, false);
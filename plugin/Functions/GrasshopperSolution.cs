@@ -31,6 +31,12 @@ public partial class RhinoMCPFunctions
         bool recompute = OptionalBool(parameters, "recompute", false);
         int expiredCount = 0;
 
+        // ExpireSolution's argument means "start a new solution now", and
+        // downstream objects are always expired with it. Mark every target
+        // expired first, then solve at most once below, instead of kicking off
+        // one solution per selected component.
+        bool solveSelected = false;
+
         var componentIds = parameters["component_ids"]?.ToObject<List<string>>() ?? new List<string>();
         if (componentIds.Count > 0)
         {
@@ -43,16 +49,18 @@ public partial class RhinoMCPFunctions
                 var obj = doc.FindObject(guid, true);
                 if (obj != null)
                 {
-                    obj.ExpireSolution(expireDownstream);
+                    obj.ExpireSolution(false);
                     expiredCount++;
                 }
             }
+            solveSelected = expireDownstream && expiredCount > 0;
         }
         else if (HasAnySelector(parameters))
         {
             var obj = FindGhObject(doc, parameters);
-            obj.ExpireSolution(expireDownstream);
+            obj.ExpireSolution(false);
             expiredCount = 1;
+            solveSelected = expireDownstream;
         }
         else
         {
@@ -63,7 +71,8 @@ public partial class RhinoMCPFunctions
             }
         }
 
-        if (recompute)
+        bool recomputed = recompute || solveSelected;
+        if (recomputed)
         {
             RunGrasshopperSolution(doc, false);
         }
@@ -71,8 +80,8 @@ public partial class RhinoMCPFunctions
         return new JObject
         {
             ["expired_count"] = expiredCount,
-            ["recomputed"] = recompute,
-            ["message"] = $"Expired {expiredCount} Grasshopper object(s)" + (recompute ? " and triggered recompute" : "")
+            ["recomputed"] = recomputed,
+            ["message"] = $"Expired {expiredCount} Grasshopper object(s)" + (recomputed ? " and triggered recompute" : "")
         };
     }
 
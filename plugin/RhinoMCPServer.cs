@@ -186,6 +186,9 @@ namespace RhinoMCPPlugin
 
             try
             {
+                // Responses are single small frames; send them immediately
+                // instead of letting Nagle wait for more data.
+                client.NoDelay = true;
                 NetworkStream stream = client.GetStream();
 
                 while (IsRunning())
@@ -274,10 +277,14 @@ namespace RhinoMCPPlugin
                                 }
                             }
                         }
-                        else
+                        else if (client.Client.Poll(100000, SelectMode.SelectRead) && client.Available == 0)
                         {
-                            // No data available, sleep a bit to prevent CPU overuse
-                            Thread.Sleep(50);
+                            // Poll blocks until data arrives (up to 100 ms, so Stop()
+                            // is still noticed) instead of sleeping a fixed interval,
+                            // so the next command is read as soon as it lands.
+                            // Readable with nothing to read means the peer closed.
+                            RhinoApp.WriteLine("Client disconnected");
+                            break;
                         }
                     }
                     catch (Exception e)
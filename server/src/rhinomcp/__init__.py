@@ -16,7 +16,6 @@ except PackageNotFoundError:
 # IMPORTANT: server (mcp, get_rhino_connection, logger) must be imported BEFORE
 # tool auto-discovery below — tool modules import from this package's namespace.
 # These imports look "unused" to ruff but they form the package's public API.
-from .static.rhinoscriptsyntax import rhinoscriptsyntax_json as rhinoscriptsyntax_json
 from .server import (  # noqa: F401  (public re-exports)
     RhinoConnection,
     get_rhino_connection,
@@ -55,3 +54,15 @@ def _discover_and_register_tools() -> None:
 
 _discover_and_register_tools()
 del _discover_and_register_tools
+
+
+# The RhinoScript catalog is large and only needed by the documentation
+# tools/resources, so `rhinomcp.rhinoscriptsyntax_json` is resolved on first
+# access (PEP 562) instead of at package import.
+def __getattr__(name: str):
+    if name == "rhinoscriptsyntax_json":
+        from .static.rhinoscriptsyntax import rhinoscriptsyntax_json
+
+        globals()[name] = rhinoscriptsyntax_json
+        return rhinoscriptsyntax_json
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 # server.py
 from mcp.server.fastmcp import FastMCP
 import socket
+import functools
 import json
 import logging
 import os
@@ -8,9 +9,15 @@ import threading
 import time
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional
 
-from rhinomcp.static.rhinoscriptsyntax import rhinoscriptsyntax_json
+# orjson is an optional speedup for the wire codec (pip install
+# "rhinomcp[speedups]"): it encodes straight to UTF-8 bytes and parses bytes
+# without a separate decode pass. The stdlib json module is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration from environment variables
 RHINO_HOST = os.getenv("RHINO_MCP_HOST", "127.0.0.1")
@@ -30,6 +37,14 @@ if RHINO_HOST not in ("127.0.0.1", "::1", "localhost") and not RHINO_ALLOW_REMOT
         "set RHINO_MCP_ALLOW_REMOTE=1 to acknowledge the risk and proceed."
     )
 RHINO_TIMEOUT = float(os.getenv("RHINO_MCP_TIMEOUT", "15.0"))
+# Grasshopper catalog commands (component search / type info) answer from the
+# installed component library, which only changes when plugins load. Their
+# results are reused for this many seconds while the socket stays up; 0
+# disables the cache.
+RHINO_GH_CATALOG_TTL = float(os.getenv("RHINO_MCP_GH_CATALOG_TTL", "300"))
+# Every command's round-trip time is logged at INFO; ones at or above this many
+# milliseconds are logged as warnings so slow tools stand out.
+RHINO_SLOW_COMMAND_MS = float(os.getenv("RHINO_MCP_SLOW_COMMAND_MS", "2000"))
 # Opt-in perception: when enabled, every mutating command carries an
 # `include_delta` flag on the envelope, and the plugin attaches a `_delta` block
 # (created_ids / deleted_ids / count_before / count_after) to the result so a
@@ -76,7 +91,8 @@ logger.setLevel(log_level)
 
 if _RHINO_VALIDATE_UNKNOWN is not None:
     logger.warning(
-        f"Unknown RHINO_MCP_VALIDATE={_RHINO_VALIDATE_UNKNOWN!r}; falling back to 'warn'."
+        "Unknown RHINO_MCP_VALIDATE=%r; falling back to 'warn'.",
+        _RHINO_VALIDATE_UNKNOWN,
     )
 
 if RHINO_DEBUG:
@@ -119,6 +135,21 @@ READONLY_RETRY_COMMANDS = {
 }
 
 
+def _encode_json(obj: Any) -> bytes:
+    """Serialize a command envelope to UTF-8 JSON bytes."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches json.dumps, which stringifies int/float keys.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _decode_json(data: bytes) -> Any:
+    """Parse a UTF-8 JSON response payload."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class TransientRhinoConnectionError(ConnectionError):
     """A connected Rhino socket dropped while a command was in flight."""
 
@@ -156,10 +187,13 @@ class RhinoConnection:
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Rhino at {self.host}:{self.port}")
+            # Commands are small request/response frames; don't let Nagle hold
+            # a frame back waiting to coalesce with data that never comes.
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            logger.info("Connected to Rhino at %s:%s", self.host, self.port)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to Rhino: {str(e)}")
+            logger.error("Failed to connect to Rhino: %s", e)
             self.sock = None
             return False
 
@@ -169,28 +203,35 @@ class RhinoConnection:
             try:
                 self.sock.close()
             except Exception as e:
-                logger.error(f"Error disconnecting from Rhino: {str(e)}")
+                logger.error("Error disconnecting from Rhino: %s", e)
             finally:
                 self.sock = None
 
-    def _recv_exact(self, sock, num_bytes, buffer_size=8192):
+    def _recv_exact(self, sock, num_bytes, buffer_size=65536):
         """Receive exactly num_bytes from sock.
 
+        The frame length is known up front, so chunks are written into one
+        preallocated buffer through a memoryview and that buffer is returned
+        as-is: no regrowth while reading and no final copy.
+
         Raises ConnectionResetError if the peer closes mid-message; lets
         socket.timeout propagate so the caller's timeout handling applies.
         """
-        received = bytearray()
-        while len(received) < num_bytes:
-            chunk = sock.recv(min(buffer_size, num_bytes - len(received)))
-            if not chunk:
-                raise ConnectionResetError(
-                    "Connection closed mid-message "
-                    f"({len(received)}/{num_bytes} bytes received)"
-                )
-            received.extend(chunk)
-        return bytes(received)
+        received = bytearray(num_bytes)
+        got = 0
+        with memoryview(received) as view:
+            while got < num_bytes:
+                chunk = sock.recv(min(buffer_size, num_bytes - got))
+                if not chunk:
+                    raise ConnectionResetError(
+                        "Connection closed mid-message "
+                        f"({got}/{num_bytes} bytes received)"
+                    )
+                view[got : got + len(chunk)] = chunk
+                got += len(chunk)
+        return received
 
-    def receive_full_response(self, sock, buffer_size=8192):
+    def receive_full_response(self, sock, buffer_size=65536):
         """Receive one length-prefixed response frame.
 
         Every message on the wire is a 4-byte big-endian length header followed
@@ -220,7 +261,7 @@ class RhinoConnection:
             )
 
         payload = self._recv_exact(sock, frame_length, buffer_size)
-        logger.info(f"Received complete response ({len(payload)} bytes)")
+        logger.info("Received complete response (%d bytes)", len(payload))
         return payload
 
     def send_command(
@@ -229,7 +270,20 @@ class RhinoConnection:
         """Send a command to Rhino and return the response. Thread-safe: serialized
         across concurrent callers so request/response framing isn't interleaved."""
         with self._send_lock:
-            return self._send_command_locked(command_type, params)
+            # Timed after the lock is acquired, so this is Rhino's round-trip
+            # for the command (retry included), not time spent queued behind
+            # another caller.
+            started = time.perf_counter()
+            try:
+                return self._send_command_locked(command_type, params)
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                if elapsed_ms >= RHINO_SLOW_COMMAND_MS:
+                    logger.warning(
+                        "Slow command %s took %.0f ms", command_type, elapsed_ms
+                    )
+                else:
+                    logger.info("Command %s took %.1f ms", command_type, elapsed_ms)
 
     def _send_command_locked(
         self, command_type: str, params: Dict[str, Any] = {}
@@ -245,7 +299,8 @@ class RhinoConnection:
                     raise
                 logger.warning(
                     "Transient Rhino connection drop during read-only command "
-                    f"{command_type}; retrying once."
+                    "%s; retrying once.",
+                    command_type,
                 )
                 self.disconnect()
                 time.sleep(0.2)
@@ -271,9 +326,12 @@ class RhinoConnection:
             command["include_health"] = True
 
         try:
-            # Log the command being sent
-            logger.info(f"Sending command: {command_type}")
-            logger.debug(f"Command params: {json.dumps(params, indent=2)}")
+            # Log the command being sent. The pretty-printed dumps below are
+            # only built when DEBUG is on; lazy %-args cover the rest.
+            debug_logging = logger.isEnabledFor(logging.DEBUG)
+            logger.info("Sending command: %s", command_type)
+            if debug_logging:
+                logger.debug("Command params: %s", json.dumps(params, indent=2))
 
             # Pre-flight: validate against the JSON Schema contract before touching
             # the socket. In 'warn' mode we log and continue (safe default); in
@@ -304,11 +362,13 @@ class RhinoConnection:
                 raise Exception("Socket is not connected")
 
             # Send the command as one length-prefixed frame
-            command_json = json.dumps(command)
-            logger.debug(
-                f"Raw command JSON ({len(command_json)} bytes): {command_json[:500]}..."
-            )
-            command_bytes = command_json.encode("utf-8")
+            command_bytes = _encode_json(command)
+            if debug_logging:
+                logger.debug(
+                    "Raw command JSON (%d bytes): %s...",
+                    len(command_bytes),
+                    command_bytes[:500].decode("utf-8", "replace"),
+                )
             header = len(command_bytes).to_bytes(FRAME_HEADER_SIZE, "big")
             self.sock.sendall(header + command_bytes)
             logger.debug("Command sent, waiting for response...")
@@ -318,14 +378,17 @@ class RhinoConnection:
 
             # Receive the response using the improved receive_full_response method
             response_data = self.receive_full_response(self.sock)
-            logger.debug(f"Received {len(response_data)} bytes of data")
+            logger.debug("Received %d bytes of data", len(response_data))
 
-            response = json.loads(response_data.decode("utf-8"))
-            logger.info(f"Response status: {response.get('status', 'unknown')}")
-            logger.debug(f"Full response: {json.dumps(response, indent=2)[:1000]}...")
+            response = _decode_json(response_data)
+            logger.info("Response status: %s", response.get("status", "unknown"))
+            if debug_logging:
+                logger.debug(
+                    "Full response: %s...", json.dumps(response, indent=2)[:1000]
+                )
 
             if response.get("status") == "error":
-                logger.error(f"Rhino error: {response.get('message')}")
+                logger.error("Rhino error: %s", response.get("message"))
                 raise Exception(response.get("message", "Unknown error from Rhino"))
 
             result = response.get("result", {})
@@ -370,8 +433,9 @@ class RhinoConnection:
                         is_verdict = isinstance(ve, jsonschema.ValidationError)
                     if not is_verdict:
                         logger.warning(
-                            f"Could not validate response for {command_type} "
-                            f"(schema error): {ve}"
+                            "Could not validate response for %s (schema error): %s",
+                            command_type,
+                            ve,
                         )
                     elif RHINO_VALIDATE == "strict":
                         raise ValueError(
@@ -380,7 +444,7 @@ class RhinoConnection:
                         ) from ve
                     else:
                         logger.warning(
-                            f"Response validation failed for {command_type}: {ve}"
+                            "Response validation failed for %s: %s", command_type, ve
                         )
 
             return result
@@ -393,7 +457,7 @@ class RhinoConnection:
                 "Timeout waiting for Rhino response - try simplifying your request"
             )
         except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-            logger.error(f"Socket connection error: {str(e)}")
+            logger.error("Socket connection error: %s", e)
             self.disconnect()
             raise TransientRhinoConnectionError(
                 f"Connection to Rhino was interrupted at {self.host}:{self.port}. "
@@ -403,7 +467,7 @@ class RhinoConnection:
         except TransientRhinoConnectionError:
             raise
         except OSError as e:
-            logger.error(f"Socket OS error: {str(e)}")
+            logger.error("Socket OS error: %s", e)
             self.disconnect()
             raise TransientRhinoConnectionError(
                 f"Connection to Rhino was interrupted at {self.host}:{self.port}. "
@@ -411,17 +475,17 @@ class RhinoConnection:
                 "and run the Rhino command `mcpstart`."
             ) from e
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON response from Rhino: {str(e)}")
+            logger.error("Invalid JSON response from Rhino: %s", e)
             # Try to log what was received
             if "response_data" in locals() and response_data:  # type: ignore
-                logger.error(f"Raw response (first 200 bytes): {response_data[:200]}")
+                logger.error("Raw response (first 200 bytes): %s", response_data[:200])
             raise Exception(f"Invalid response from Rhino: {str(e)}")
         except ValueError:
             # Pre/post-flight validation failures — local, not a transport
             # issue. Propagate.
             raise
         except Exception as e:
-            logger.error(f"Error communicating with Rhino: {str(e)}")
+            logger.error("Error communicating with Rhino: %s", e)
             # Don't try to reconnect here - let the get_rhino_connection handle reconnection
             self.disconnect()
             raise Exception(f"Communication error with Rhino: {str(e)}")
@@ -443,7 +507,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
             get_rhino_connection()
             logger.info("Successfully connected to Rhino on startup")
         except Exception as e:
-            logger.warning(f"Could not connect to Rhino on startup: {str(e)}")
+            logger.warning("Could not connect to Rhino on startup: %s", e)
             logger.warning(rhino_startup_error_message(RHINO_HOST, RHINO_PORT))
 
         # Return an empty context - we're using the global connection
@@ -465,6 +529,8 @@ mcp = FastMCP("RhinoMCP", lifespan=server_lifespan)
 # ============================================================================
 # MCP Resources - Browsable RhinoScript Documentation
 # ============================================================================
+# The RhinoScript catalog is ~1.5 MB of source, so it is imported on first use
+# rather than at server import; sessions that never browse the docs skip it.
 
 
 @mcp.resource("rhinoscript://modules")
@@ -473,17 +539,7 @@ def resource_list_modules() -> str:
     List all RhinoScript modules with function counts.
     Browse this to discover what's available.
     """
-    lines = ["# RhinoScript Modules\n"]
-    lines.append("| Module | Functions |")
-    lines.append("|--------|-----------|")
-
-    for module in sorted(rhinoscriptsyntax_json, key=lambda m: m["ModuleName"]):
-        name = module["ModuleName"]
-        count = len(module["functions"])
-        lines.append(f"| {name} | {count} |")
-
-    lines.append("\n\nUse `rhinoscript://module/<name>` to browse a specific module.")
-    return "\n".join(lines)
+    return _render_module_list()
 
 
 @mcp.resource("rhinoscript://module/{module_name}")
@@ -491,22 +547,13 @@ def resource_get_module(module_name: str) -> str:
     """
     Get all functions in a specific module with signatures.
     """
-    for module in rhinoscriptsyntax_json:
-        if module["ModuleName"].lower() == module_name.lower():
-            lines = [f"# RhinoScript Module: {module['ModuleName']}\n"]
-            lines.append(f"Total functions: {len(module['functions'])}\n")
-
-            for func in module["functions"]:
-                sig = func.get("Signature", func["Name"] + "()")
-                desc = func.get("Description", "")[:100]
-                lines.append(f"## {func['Name']}")
-                lines.append(f"```python\nrs.{sig}\n```")
-                lines.append(f"{desc}\n")
+    page = _render_module(module_name.lower())
+    if page is None:
+        from rhinomcp.static.rhinoscriptsyntax import rhinoscriptsyntax_json
 
-            return "\n".join(lines)
-
-    available = ", ".join(sorted(m["ModuleName"] for m in rhinoscriptsyntax_json))
-    return f"Module '{module_name}' not found.\n\nAvailable modules: {available}"
+        available = ", ".join(sorted(m["ModuleName"] for m in rhinoscriptsyntax_json))
+        return f"Module '{module_name}' not found.\n\nAvailable modules: {available}"
+    return page
 
 
 @mcp.resource("rhinoscript://function/{function_name}")
@@ -514,35 +561,90 @@ def resource_get_function(function_name: str) -> str:
     """
     Get complete documentation for a specific function.
     """
+    page = _render_function(function_name.lower())
+    if page is None:
+        return f"Function '{function_name}' not found. Use search_rhinoscript_functions() to find functions."
+    return page
+
+
+# The catalog never changes at runtime, so each page is rendered once and
+# served from cache afterwards. Keys are lower-cased because lookups are
+# case-insensitive; a miss caches None and the resource words the message.
+@functools.lru_cache(maxsize=1)
+def _render_module_list() -> str:
+    from rhinomcp.static.rhinoscriptsyntax import rhinoscriptsyntax_json
+
+    modules = sorted(rhinoscriptsyntax_json, key=lambda m: m["ModuleName"])
+    return "\n".join(
+        (
+            "# RhinoScript Modules\n",
+            "| Module | Functions |",
+            "|--------|-----------|",
+            *(f"| {m['ModuleName']} | {len(m['functions'])} |" for m in modules),
+            "\n\nUse `rhinoscript://module/<name>` to browse a specific module.",
+        )
+    )
+
+
+def _iter_module_lines(module: Dict[str, Any]):
+    """Yield the Markdown lines of one module page, one entry per function."""
+    functions = module["functions"]
+    yield f"# RhinoScript Module: {module['ModuleName']}\n"
+    yield f"Total functions: {len(functions)}\n"
+    for func in functions:
+        get = func.get
+        name = func["Name"]
+        sig = get("Signature", name + "()")
+        desc = get("Description", "")[:100]
+        yield f"## {name}\n```python\nrs.{sig}\n```\n{desc}\n"
+
+
+@functools.lru_cache(maxsize=64)
+def _render_module(module_name: str) -> Optional[str]:
+    from rhinomcp.static.rhinoscriptsyntax import rhinoscriptsyntax_json
+
     for module in rhinoscriptsyntax_json:
-        for func in module["functions"]:
-            if func["Name"].lower() == function_name.lower():
-                lines = [f"# {func['Name']}\n"]
-                lines.append(f"**Module:** {module['ModuleName']}\n")
+        if module["ModuleName"].lower() == module_name:
+            return "\n".join(_iter_module_lines(module))
 
-                sig = func.get("Signature", func["Name"] + "()")
-                lines.append(f"## Signature\n```python\nrs.{sig}\n```\n")
+    return None
 
-                if func.get("Description"):
-                    lines.append(f"## Description\n{func['Description']}\n")
 
-                if func.get("ArgumentDesc"):
-                    lines.append(f"## Parameters\n{func['ArgumentDesc']}\n")
+@functools.lru_cache(maxsize=256)
+def _render_function(function_name: str) -> Optional[str]:
+    # Same lower-cased name index the documentation tools use, so a lookup is
+    # one dict probe instead of a scan over every module's functions.
+    from rhinomcp.tools.rhinoscript_docs import _functions_by_name
 
-                if func.get("Returns"):
-                    lines.append(f"## Returns\n{func['Returns']}\n")
+    entry = _functions_by_name().get(function_name)
+    if entry is None:
+        return None
+    module, func = entry
 
-                if func.get("Example"):
-                    examples = func["Example"]
-                    if isinstance(examples, list):
-                        example_code = "\n".join(examples)
-                    else:
-                        example_code = examples
-                    lines.append(f"## Example\n```python\n{example_code}\n```\n")
+    lines = [f"# {func['Name']}\n"]
+    lines.append(f"**Module:** {module['ModuleName']}\n")
+
+    sig = func.get("Signature", func["Name"] + "()")
+    lines.append(f"## Signature\n```python\nrs.{sig}\n```\n")
+
+    if func.get("Description"):
+        lines.append(f"## Description\n{func['Description']}\n")
 
-                return "\n".join(lines)
+    if func.get("ArgumentDesc"):
+        lines.append(f"## Parameters\n{func['ArgumentDesc']}\n")
 
-    return f"Function '{function_name}' not found. Use search_rhinoscript_functions() to find functions."
+    if func.get("Returns"):
+        lines.append(f"## Returns\n{func['Returns']}\n")
+
+    if func.get("Example"):
+        examples = func["Example"]
+        if isinstance(examples, list):
+            example_code = "\n".join(examples)
+        else:
+            example_code = examples
+        lines.append(f"## Example\n```python\n{example_code}\n```\n")
+
+    return "\n".join(lines)
 
 
 # Resource endpoints
@@ -556,14 +658,23 @@ def get_rhino_connection():
     """Get or create a persistent Rhino connection (thread-safe)"""
     global _rhino_connection
 
+    # Fast path: once created, the connection object is reused for the life of
+    # the server (it reconnects its own socket), so a plain read is enough and
+    # the lock is only taken on cold start.
+    conn = _rhino_connection
+    if conn is not None:
+        return conn
+
     with _connection_lock:
-        # Create a new connection if needed
+        # Re-check under the lock: another thread may have connected first
         if _rhino_connection is None:
-            _rhino_connection = RhinoConnection(host=RHINO_HOST, port=RHINO_PORT)
-            if not _rhino_connection.connect():
+            # Connect a local first and publish it only once it is up, so the
+            # lock-free read above never sees a half-initialised connection.
+            conn = RhinoConnection(host=RHINO_HOST, port=RHINO_PORT)
+            if not conn.connect():
                 logger.error("Failed to connect to Rhino")
-                _rhino_connection = None
                 raise Exception(rhino_startup_error_message(RHINO_HOST, RHINO_PORT))
+            _rhino_connection = conn
             logger.info("Created new persistent connection to Rhino")
 
         return _rhino_connection
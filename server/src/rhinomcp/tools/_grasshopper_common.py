@@ -1,13 +1,72 @@
 """Shared helpers for Grasshopper MCP tool wrappers."""
 
-from typing import Any, Dict, List, Union
+import copy
+import json
+import threading
+import time
+from typing import Any, Dict, List, Tuple, Union
 
-from rhinomcp.server import get_rhino_connection
+from rhinomcp.server import RHINO_GH_CATALOG_TTL, get_rhino_connection
 
 
 JsonValue = Union[float, int, str, bool, List[Any], Dict[str, Any]]
 
+# Read-only commands answered from Grasshopper's installed component library
+# rather than the canvas. Their results are cached per (command, params) so
+# repeated searches and type lookups skip the round-trip to Rhino.
+CATALOG_COMMANDS = frozenset(
+    {
+        "gh_search_components",
+        "gh_batch_search_components",
+        "gh_list_component_categories",
+        "gh_get_available_components",
+        "gh_get_component_type_info",
+        "gh_batch_get_component_type_info",
+    }
+)
+CATALOG_CACHE_MAX_ENTRIES = 256
+
+# (command, canonical params) -> (socket that answered, expiry, result). An
+# entry is only reused while that same socket is still the live connection, so
+# a reconnect (e.g. Rhino restarted with different plugins) starts fresh.
+_catalog_cache: Dict[Tuple[str, str], Tuple[Any, float, Dict[str, Any]]] = {}
+_catalog_lock = threading.Lock()
+
+
+def require_selector(command: str, **selectors: Any) -> None:
+    """Raise before the round-trip when none of the given selectors is set.
+
+    Mirrors the plugin's own "Either ... is required" check, so a call that
+    can only fail never touches the socket.
+    """
+    if not any(selectors.values()):
+        raise ValueError(f"{command}: either {' or '.join(selectors)} is required.")
+
 
 def send_grasshopper_command(command: str, params: Dict[str, Any]) -> Dict[str, Any]:
     rhino = get_rhino_connection()
-    return rhino.send_command(command, params)
+    if command not in CATALOG_COMMANDS or RHINO_GH_CATALOG_TTL <= 0:
+        return rhino.send_command(command, params)
+
+    key = (command, json.dumps(params, sort_keys=True))
+    with _catalog_lock:
+        entry = _catalog_cache.get(key)
+    if entry is not None:
+        sock, expires, result = entry
+        if sock is rhino.sock and time.monotonic() < expires:
+            # Hand out a copy so a caller editing its result can't change
+            # what later hits see.
+            return copy.deepcopy(result)
+
+    result = rhino.send_command(command, params)
+    with _catalog_lock:
+        _catalog_cache.pop(key, None)
+        if len(_catalog_cache) >= CATALOG_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so this evicts the oldest entry.
+            del _catalog_cache[next(iter(_catalog_cache))]
+        _catalog_cache[key] = (
+            rhino.sock,
+            time.monotonic() + RHINO_GH_CATALOG_TTL,
+            copy.deepcopy(result),
+        )
+    return result
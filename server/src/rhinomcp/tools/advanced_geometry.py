@@ -61,7 +61,7 @@ def loft(
             "message": result.get("message", "Loft created successfully")
         }
     except Exception as e:
-        logger.error(f"Error in loft: {str(e)}")
+        logger.error("Error in loft: %s", e)
         return {"success": False, "message": str(e)}
 
 
@@ -110,7 +110,7 @@ def extrude_curve(
             "message": result.get("message", "Extrusion created successfully")
         }
     except Exception as e:
-        logger.error(f"Error in extrude_curve: {str(e)}")
+        logger.error("Error in extrude_curve: %s", e)
         return {"success": False, "message": str(e)}
 
 
@@ -160,7 +160,7 @@ def sweep1(
             "message": result.get("message", "Sweep created successfully")
         }
     except Exception as e:
-        logger.error(f"Error in sweep1: {str(e)}")
+        logger.error("Error in sweep1: %s", e)
         return {"success": False, "message": str(e)}
 
 
@@ -210,7 +210,7 @@ def offset_curve(
             "message": result.get("message", "Offset created successfully")
         }
     except Exception as e:
-        logger.error(f"Error in offset_curve: {str(e)}")
+        logger.error("Error in offset_curve: %s", e)
         return {"success": False, "message": str(e)}
 
 
@@ -262,5 +262,5 @@ def pipe(
             "message": result.get("message", "Pipe created successfully")
         }
     except Exception as e:
-        logger.error(f"Error in pipe: {str(e)}")
+        logger.error("Error in pipe: %s", e)
         return {"success": False, "message": str(e)}
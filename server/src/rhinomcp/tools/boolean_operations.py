@@ -35,7 +35,7 @@ def boolean_union(
         result = rhino.send_command("boolean_union", params)
         return f"{result['message']}. Result IDs: {result['result_ids']}"
     except Exception as e:
-        logger.error(f"Error in boolean union: {str(e)}")
+        logger.error("Error in boolean union: %s", e)
         return f"Error in boolean union: {str(e)}"
 
 
@@ -74,7 +74,7 @@ def boolean_difference(
         result = rhino.send_command("boolean_difference", params)
         return f"{result['message']}. Result IDs: {result['result_ids']}"
     except Exception as e:
-        logger.error(f"Error in boolean difference: {str(e)}")
+        logger.error("Error in boolean difference: %s", e)
         return f"Error in boolean difference: {str(e)}"
 
 
@@ -110,5 +110,5 @@ def boolean_intersection(
         result = rhino.send_command("boolean_intersection", params)
         return f"{result['message']}. Result IDs: {result['result_ids']}"
     except Exception as e:
-        logger.error(f"Error in boolean intersection: {str(e)}")
+        logger.error("Error in boolean intersection: %s", e)
         return f"Error in boolean intersection: {str(e)}"
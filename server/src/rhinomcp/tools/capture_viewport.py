@@ -75,13 +75,15 @@ def capture_viewport(
         image_data = base64.b64decode(result["image_data"])
 
         logger.info(
-            f"Captured viewport '{result.get('viewport_name', viewport)}' "
-            f"({result.get('width', width)}x{result.get('height', height)})"
+            "Captured viewport '%s' (%sx%s)",
+            result.get("viewport_name", viewport),
+            result.get("width", width),
+            result.get("height", height),
         )
 
         # Return MCP Image object for Claude to analyze
         return Image(data=image_data, format="png")
 
     except Exception as e:
-        logger.error(f"Error capturing viewport: {str(e)}")
+        logger.error("Error capturing viewport: %s", e)
         raise Exception(f"Error capturing viewport: {str(e)}")
@@ -41,6 +41,6 @@ def create_layer(
         
         return f"Created layer: {result['name']}"
     except Exception as e:
-        logger.error(f"Error creating layer: {str(e)}")
+        logger.error("Error creating layer: %s", e)
         return f"Error creating layer: {str(e)}"
  
\ No newline at end of file
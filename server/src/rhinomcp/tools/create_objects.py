@@ -95,6 +95,6 @@ def create_objects(
             error_details = "; ".join([f"{e['name']}: {e['error']}" for e in errors])
             return f"Partial success: Created {success_count}/{total} objects. {failure_count} failed: {error_details}"
     except Exception as e:
-        logger.error(f"Error creating objects: {str(e)}")
+        logger.error("Error creating objects: %s", e)
         return f"Error creating objects: {str(e)}"
 
@@ -54,7 +54,7 @@ def project_curve(
             "message": result.get("message", "Curve projected successfully")
         }
     except Exception as e:
-        logger.error(f"Error in project_curve: {str(e)}")
+        logger.error("Error in project_curve: %s", e)
         return {"success": False, "message": str(e)}
 
 
@@ -98,7 +98,7 @@ def intersect_curves(
             "message": result.get("message", "Intersections found")
         }
     except Exception as e:
-        logger.error(f"Error in intersect_curves: {str(e)}")
+        logger.error("Error in intersect_curves: %s", e)
         return {"success": False, "message": str(e)}
 
 
@@ -147,5 +147,5 @@ def split_curve(
             "message": result.get("message", "Curve split successfully")
         }
     except Exception as e:
-        logger.error(f"Error in split_curve: {str(e)}")
+        logger.error("Error in split_curve: %s", e)
         return {"success": False, "message": str(e)}
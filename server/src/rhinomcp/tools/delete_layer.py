@@ -41,6 +41,6 @@ def delete_layer(
 
         return result["message"]
     except Exception as e:
-        logger.error(f"Error deleting layer: {str(e)}")
+        logger.error("Error deleting layer: %s", e)
         return f"Error deleting layer: {str(e)}"
  
\ No newline at end of file
@@ -99,5 +99,5 @@ def execute_rhinocommon_csharp_code(
         return rhino.send_command("execute_rhinocommon_csharp_code", {"code": code})
 
     except Exception as e:
-        logger.error(f"Error executing C# code: {str(e)}")
+        logger.error("Error executing C# code: %s", e)
         return {"success": False, "message": str(e)}
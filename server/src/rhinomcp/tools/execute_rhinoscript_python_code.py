@@ -86,5 +86,5 @@ def execute_rhinoscript_python_code(
         rhino = get_rhino_connection()
         return rhino.send_command("execute_rhinoscript_python_code", {"code": code})
     except Exception as e:
-        logger.error(f"Error executing code: {str(e)}")
+        logger.error("Error executing code: %s", e)
         return {"success": False, "message": str(e)}
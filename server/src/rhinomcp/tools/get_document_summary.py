@@ -25,5 +25,5 @@ def get_document_summary(ctx: Context) -> str:
         result = rhino.send_command("get_document_summary")
         return json.dumps(result, indent=2)
     except Exception as e:
-        logger.error(f"Error getting document summary from Rhino: {str(e)}")
+        logger.error("Error getting document summary from Rhino: %s", e)
         return f"Error getting document summary: {str(e)}"
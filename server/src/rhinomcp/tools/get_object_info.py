@@ -38,7 +38,7 @@ def get_object_info(ctx: Context, id: str = None, name: str = None) -> Dict[str,
         return rhino.send_command("get_object_info", params)
 
     except Exception as e:
-        logger.error(f"Error getting object info from Rhino: {str(e)}")
+        logger.error("Error getting object info from Rhino: %s", e)
         return {
             "error": str(e)
         }
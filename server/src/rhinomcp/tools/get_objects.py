@@ -64,5 +64,5 @@ def get_objects(
         return json.dumps(result, indent=2)
 
     except Exception as e:
-        logger.error(f"Error getting objects from Rhino: {str(e)}")
+        logger.error("Error getting objects from Rhino: %s", e)
         return f"Error getting objects: {str(e)}"
@@ -40,6 +40,6 @@ def get_or_set_current_layer(
         
         return f"Current layer: {result['name']}"
     except Exception as e:
-        logger.error(f"Error getting or setting current layer: {str(e)}")
+        logger.error("Error getting or setting current layer: %s", e)
         return f"Error getting or setting current layer: {str(e)}"
  
\ No newline at end of file
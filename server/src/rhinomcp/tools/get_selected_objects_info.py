@@ -15,6 +15,6 @@ def get_selected_objects_info(ctx: Context, include_attributes: bool = False) ->
         result = rhino.send_command("get_selected_objects_info", {"include_attributes": include_attributes})
         return json.dumps(result, indent=2)
     except Exception as e:
-        logger.error(f"Error getting selected objects from Rhino: {str(e)}")
+        logger.error("Error getting selected objects from Rhino: %s", e)
         return f"Error getting selected objects: {str(e)}"
 
@@ -8,6 +8,30 @@ from rhinomcp.server import mcp
 from rhinomcp.tools._grasshopper_common import JsonValue, send_grasshopper_command
 
 
+def _check_components(components: List[Dict[str, Any]]) -> None:
+    """Reject component lists the plugin would refuse, before the round-trip."""
+    if not components:
+        raise ValueError(
+            "gh_build_graph components must contain at least one component."
+        )
+    seen = set()
+    for spec in components:
+        alias = spec.get("alias")
+        if not isinstance(alias, str) or not alias.strip():
+            raise ValueError("Every gh_build_graph component requires an alias.")
+        if not (
+            spec.get("component_name") or spec.get("component_guid") or spec.get("guid")
+        ):
+            raise ValueError(
+                f"Component '{alias}' is missing component_name or component_guid."
+            )
+        # The plugin keys aliases case-insensitively.
+        key = alias.lower()
+        if key in seen:
+            raise ValueError(f"Duplicate Grasshopper build alias '{alias}'.")
+        seen.add(key)
+
+
 @mcp.tool()
 def gh_build_graph(
     ctx: Context,
@@ -43,6 +67,7 @@ def gh_build_graph(
     connections=[{"source": "a", "target": "add", "target_input_index": 0}],
     layout={"enabled": True, "max_columns": 6}
     """
+    _check_components(components)
     params: Dict[str, Any] = {
         "components": components,
         "recompute": recompute,
@@ -51,15 +76,15 @@ def gh_build_graph(
     }
     if graph_id is not None:
         params["graph_id"] = graph_id
-    if connections is not None:
+    if connections:
         params["connections"] = connections
-    if values is not None:
+    if values:
         params["values"] = values
     if preview_updates is not None:
         params["preview_updates"] = preview_updates
     if preview_policy is not None:
         params["preview_policy"] = preview_policy
-    if groups is not None:
+    if groups:
         params["groups"] = groups
     if layout is not None:
         params["layout"] = layout
@@ -6,7 +6,10 @@ from mcp.server.fastmcp import Context
 from mcp.types import ToolAnnotations
 
 from rhinomcp.server import mcp
-from rhinomcp.tools._grasshopper_common import send_grasshopper_command
+from rhinomcp.tools._grasshopper_common import (
+    require_selector,
+    send_grasshopper_command,
+)
 
 
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -37,9 +40,11 @@ def gh_batch_search_components(
     ambiguous to disambiguate names like "Square" or "Grid" by category,
     subcategory, nickname, or GUID before creating components.
     """
+    # Results come back keyed by query string, so repeats only cost the plugin
+    # extra searches; send each distinct query once, in first-seen order.
     return send_grasshopper_command(
         "gh_batch_search_components",
-        {"queries": queries, "max_matches": max_matches},
+        {"queries": list(dict.fromkeys(queries)), "max_matches": max_matches},
     )
 
 
@@ -55,14 +60,21 @@ def gh_get_available_components(
     category: Optional[str] = None,
     include_description: bool = False,
     limit: int = 500,
+    offset: int = 0,
 ) -> Dict[str, Any]:
-    """Get installed Grasshopper components, optionally filtered by category."""
+    """Get installed Grasshopper components, optionally filtered by category.
+
+    Results are sorted by category then name. Page through a large catalog with
+    a modest limit and offset; the response reports total_matching and has_more.
+    """
     params: Dict[str, Any] = {
         "include_description": include_description,
         "limit": limit,
     }
     if category:
         params["category"] = category
+    if offset:
+        params["offset"] = offset
     return send_grasshopper_command("gh_get_available_components", params)
 
 
@@ -73,6 +85,7 @@ def gh_get_component_type_info(
     guid: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Inspect a Grasshopper component type before creating an instance."""
+    require_selector("gh_get_component_type_info", name=name, guid=guid)
     params: Dict[str, Any] = {}
     if name:
         params["name"] = name
@@ -6,7 +6,11 @@ from mcp.server.fastmcp import Context
 from mcp.types import ToolAnnotations
 
 from rhinomcp.server import mcp
-from rhinomcp.tools._grasshopper_common import JsonValue, send_grasshopper_command
+from rhinomcp.tools._grasshopper_common import (
+    JsonValue,
+    require_selector,
+    send_grasshopper_command,
+)
 
 
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -32,6 +36,9 @@ def gh_get_component_info(
     nickname: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Get detailed metadata for one Grasshopper canvas object."""
+    require_selector(
+        "gh_get_component_info", instance_id=instance_id, nickname=nickname
+    )
     params: Dict[str, Any] = {}
     if instance_id:
         params["instance_id"] = instance_id
@@ -58,7 +65,13 @@ def gh_add_component(
 
     Provide component_name or component_guid. If both are supplied, the GUID is
     resolved first to avoid ambiguous names.
+
+    Each call is a separate round-trip and solution update. To create several
+    components, use gh_build_graph, which adds and wires them in one call.
     """
+    require_selector(
+        "gh_add_component", component_name=component_name, component_guid=component_guid
+    )
     params: Dict[str, Any] = {}
     if component_name:
         params["component_name"] = component_name
@@ -114,6 +127,7 @@ def gh_delete_component(
     nickname: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Delete one Grasshopper canvas object."""
+    require_selector("gh_delete_component", instance_id=instance_id, nickname=nickname)
     params: Dict[str, Any] = {}
     if instance_id:
         params["instance_id"] = instance_id
@@ -133,6 +147,7 @@ def gh_update_component(
     preview: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """Update basic Grasshopper object metadata, position, enabled state, or preview state."""
+    require_selector("gh_update_component", instance_id=instance_id, nickname=nickname)
     params: Dict[str, Any] = {}
     if instance_id:
         params["instance_id"] = instance_id
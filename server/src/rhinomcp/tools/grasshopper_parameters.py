@@ -6,7 +6,11 @@ from mcp.server.fastmcp import Context
 from mcp.types import ToolAnnotations
 
 from rhinomcp.server import mcp
-from rhinomcp.tools._grasshopper_common import JsonValue, send_grasshopper_command
+from rhinomcp.tools._grasshopper_common import (
+    JsonValue,
+    require_selector,
+    send_grasshopper_command,
+)
 
 
 @mcp.tool()
@@ -21,8 +25,19 @@ def gh_set_parameter_value(
     max: Optional[float] = None,
     decimals: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Set a slider, toggle, panel, value list, or regular input parameter value."""
-    params: Dict[str, Any] = {"value": value, "input_index": input_index}
+    """Set a slider, toggle, panel, value list, or regular input parameter value.
+
+    Target an input by input_name or input_index; the first input is used when
+    neither is given.
+    """
+    require_selector(
+        "gh_set_parameter_value", instance_id=instance_id, nickname=nickname
+    )
+    # The plugin prefers an index over a name and defaults to the first input,
+    # so only send the index when it says something input_name can't.
+    params: Dict[str, Any] = {"value": value}
+    if input_index:
+        params["input_index"] = input_index
     if instance_id:
         params["instance_id"] = instance_id
     if nickname:
@@ -47,8 +62,17 @@ def gh_get_parameter_value(
     output_name: Optional[str] = None,
     max_items: int = 100,
 ) -> Dict[str, Any]:
-    """Read structured data from a Grasshopper output parameter."""
-    params: Dict[str, Any] = {"output_index": output_index, "max_items": max_items}
+    """Read structured data from a Grasshopper output parameter.
+
+    Target an output by output_name or output_index; the first output is used
+    when neither is given.
+    """
+    require_selector(
+        "gh_get_parameter_value", instance_id=instance_id, nickname=nickname
+    )
+    params: Dict[str, Any] = {"max_items": max_items}
+    if output_index:
+        params["output_index"] = output_index
     if instance_id:
         params["instance_id"] = instance_id
     if nickname:
@@ -52,6 +52,6 @@ def modify_objects(
             error_details = "; ".join([f"{e['id']}: {e['error']}" for e in errors])
             return f"Partial success: Modified {success_count}/{total} objects. {failure_count} failed: {error_details}"
     except Exception as e:
-        logger.error(f"Error modifying objects: {str(e)}")
+        logger.error("Error modifying objects: %s", e)
         return f"Error modifying objects: {str(e)}"
 
@@ -5,16 +5,93 @@ This module provides semantic search and comprehensive documentation retrieval
 to prevent AI hallucination when writing RhinoScript Python code.
 """
 
+import functools
+from collections import defaultdict
+
 from mcp.server.fastmcp import Context
 from mcp.types import ToolAnnotations
 from rhinomcp.server import mcp, logger
-from rhinomcp.static.rhinoscriptsyntax import rhinoscriptsyntax_json
 from typing import Any, List, Dict, Optional
 
 
-def _score_match(query_terms: List[str], text: str) -> int:
-    """Score how well query terms match the text."""
-    text_lower = text.lower()
+def _catalog() -> List[Dict[str, Any]]:
+    """The RhinoScript function catalog, imported on first use.
+
+    The catalog module is ~1.5 MB of source; deferring it keeps server startup
+    from paying for it until a documentation tool is actually called.
+    """
+    from rhinomcp.static.rhinoscriptsyntax import rhinoscriptsyntax_json
+
+    return rhinoscriptsyntax_json
+
+
+@functools.lru_cache(maxsize=1)
+def _functions_by_name() -> Dict[str, tuple]:
+    """Map lower-cased function name -> (module, function entry), built once.
+
+    Name lookups are case-insensitive, so they become a single dict probe
+    instead of a scan over every function in every module.
+    """
+    index: Dict[str, tuple] = {}
+    for module in _catalog():
+        for func in module["functions"]:
+            index.setdefault(func["Name"].lower(), (module, func))
+    return index
+
+
+@functools.lru_cache(maxsize=1)
+def _search_corpus() -> tuple:
+    """(module, function, searchable text, signature) for every catalog entry.
+
+    The text fields are lower-cased once here, so a search only scores
+    precomputed strings instead of rebuilding them per function per query.
+    """
+    return tuple(
+        (
+            module,
+            func,
+            f"{func['Name']} {func.get('Description', '')}".lower(),
+            func.get('Signature', '').lower(),
+        )
+        for module in _catalog()
+        for func in module["functions"]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _trigram_index() -> Dict[str, frozenset]:
+    """Map every 3-character substring to the corpus rows containing it.
+
+    A query term can only be a substring of a row's text if all of the
+    term's trigrams occur in that row, so intersecting their posting sets
+    yields a small candidate set with no false negatives.
+    """
+    index: Dict[str, set] = defaultdict(set)
+    for row, (_, _, searchable, signature) in enumerate(_search_corpus()):
+        for text in (searchable, signature):
+            for i in range(len(text) - 2):
+                index[text[i:i + 3]].add(row)
+    return {trigram: frozenset(rows) for trigram, rows in index.items()}
+
+
+def _candidate_rows(query_terms: List[str]) -> Optional[List[int]]:
+    """Corpus rows that may match any query term, or None to scan them all.
+
+    Terms shorter than a trigram can't be looked up in the index, so any such
+    term falls back to a full scan.
+    """
+    if any(len(term) < 3 for term in query_terms):
+        return None
+    index = _trigram_index()
+    rows: set = set()
+    for term in query_terms:
+        postings = [index.get(term[i:i + 3], frozenset()) for i in range(len(term) - 2)]
+        rows.update(frozenset.intersection(*postings))
+    return sorted(rows)
+
+
+def _score_match(query_terms: List[str], text_lower: str) -> int:
+    """Score how well query terms match the (already lower-cased) text."""
     score = 0
     for term in query_terms:
         if term in text_lower:
@@ -33,26 +110,23 @@ def _search_functions(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     query_terms = query.lower().split()
     results = []
 
-    for module in rhinoscriptsyntax_json:
-        for func in module["functions"]:
-            # Build searchable text from name and description
-            searchable = f"{func['Name']} {func.get('Description', '')}".lower()
-
-            # Score the match
-            score = _score_match(query_terms, searchable)
-
-            # Also check signature for parameter names
-            signature = func.get('Signature', '')
-            score += _score_match(query_terms, signature.lower())
-
-            if score > 0:
-                results.append({
-                    "name": func["Name"],
-                    "signature": func.get("Signature", func["Name"] + "()"),
-                    "description": func.get("Description", "")[:300],
-                    "module": module["ModuleName"],
-                    "_score": score
-                })
+    corpus = _search_corpus()
+    rows = _candidate_rows(query_terms)
+    for module, func, searchable, signature in (
+        corpus if rows is None else (corpus[row] for row in rows)
+    ):
+        # Score the name/description, then the signature for parameter names
+        score = _score_match(query_terms, searchable)
+        score += _score_match(query_terms, signature)
+
+        if score > 0:
+            results.append({
+                "name": func["Name"],
+                "signature": func.get("Signature", func["Name"] + "()"),
+                "description": func.get("Description", "")[:300],
+                "module": module["ModuleName"],
+                "_score": score
+            })
 
     # Sort by score descending, then by name
     results.sort(key=lambda x: (-x["_score"], x["name"]))
@@ -66,19 +140,19 @@ def _search_functions(query: str, limit: int = 10) -> List[Dict[str, Any]]:
 
 def _get_function_details(function_name: str) -> Optional[Dict[str, Any]]:
     """Get full documentation for a specific function."""
-    for module in rhinoscriptsyntax_json:
-        for func in module["functions"]:
-            if func["Name"].lower() == function_name.lower():
-                return {
-                    "name": func["Name"],
-                    "module": module["ModuleName"],
-                    "signature": func.get("Signature", ""),
-                    "description": func.get("Description", ""),
-                    "parameters": func.get("ArgumentDesc", ""),
-                    "returns": func.get("Returns", ""),
-                    "example": func.get("Example", []),
-                }
-    return None
+    entry = _functions_by_name().get(function_name.lower())
+    if entry is None:
+        return None
+    module, func = entry
+    return {
+        "name": func["Name"],
+        "module": module["ModuleName"],
+        "signature": func.get("Signature", ""),
+        "description": func.get("Description", ""),
+        "parameters": func.get("ArgumentDesc", ""),
+        "returns": func.get("Returns", ""),
+        "example": func.get("Example", []),
+    }
 
 
 @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -112,7 +186,7 @@ def search_rhinoscript_functions(ctx: Context, query: str, limit: int = 10) -> L
             }]
         return results
     except Exception as e:
-        logger.error(f"Error searching functions: {str(e)}")
+        logger.error("Error searching functions: %s", e)
         return [{"error": str(e)}]
 
 
@@ -156,7 +230,7 @@ def get_rhinoscript_docs(
                 "success": False,
                 "message": f"No functions found for topic '{topic}'",
                 "suggestion": "Try different keywords. Available modules: " +
-                    ", ".join(sorted(set(m["ModuleName"] for m in rhinoscriptsyntax_json)))
+                    ", ".join(sorted(set(m["ModuleName"] for m in _catalog())))
             }
 
         # Get full documentation for each function
@@ -180,7 +254,7 @@ def get_rhinoscript_docs(
         }
 
     except Exception as e:
-        logger.error(f"Error getting docs: {str(e)}")
+        logger.error("Error getting docs: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -197,7 +271,7 @@ def list_rhinoscript_modules(ctx: Context) -> Dict[str, Any]:
     """
     try:
         modules = []
-        for module in rhinoscriptsyntax_json:
+        for module in _catalog():
             module_name = module["ModuleName"]
             func_count = len(module["functions"])
             # Get first few function names as examples
@@ -219,7 +293,7 @@ def list_rhinoscript_modules(ctx: Context) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Error listing modules: {str(e)}")
+        logger.error("Error listing modules: %s", e)
         return {"error": str(e)}
 
 
@@ -239,7 +313,7 @@ def get_module_functions(ctx: Context, module_name: str) -> Dict[str, Any]:
     try:
         module_name_lower = module_name.lower()
 
-        for module in rhinoscriptsyntax_json:
+        for module in _catalog():
             if module["ModuleName"].lower() == module_name_lower:
                 functions = []
                 for func in module["functions"]:
@@ -256,12 +330,12 @@ def get_module_functions(ctx: Context, module_name: str) -> Dict[str, Any]:
                 }
 
         # Module not found
-        available = sorted(set(m["ModuleName"] for m in rhinoscriptsyntax_json))
+        available = sorted(set(m["ModuleName"] for m in _catalog()))
         return {
             "error": f"Module '{module_name}' not found",
             "available_modules": available
         }
 
     except Exception as e:
-        logger.error(f"Error getting module functions: {str(e)}")
+        logger.error("Error getting module functions: %s", e)
         return {"error": str(e)}
@@ -53,5 +53,5 @@ def run_command(ctx: Context, command: str, echo: bool = False) -> str:
             return f"Command failed: {output}"
         return "Command failed: no output captured."
     except Exception as e:
-        logger.error(f"Error running Rhino command: {str(e)}")
+        logger.error("Error running Rhino command: %s", e)
         return f"Error running Rhino command: {str(e)}"
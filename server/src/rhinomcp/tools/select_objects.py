@@ -54,6 +54,6 @@ def select_objects(
           
         return f"Selected {result['count']} objects"
     except Exception as e:
-        logger.error(f"Error selecting objects: {str(e)}")
+        logger.error("Error selecting objects: %s", e)
         return f"Error selecting objects: {str(e)}"
 
@@ -18,7 +18,7 @@ def undo(ctx: Context, steps: int = 1) -> str:
         result = rhino.send_command("undo", {"steps": steps})
         return result["message"]
     except Exception as e:
-        logger.error(f"Error undoing: {str(e)}")
+        logger.error("Error undoing: %s", e)
         return f"Error undoing: {str(e)}"
 
 
@@ -38,5 +38,5 @@ def redo(ctx: Context, steps: int = 1) -> str:
         result = rhino.send_command("redo", {"steps": steps})
         return result["message"]
     except Exception as e:
-        logger.error(f"Error redoing: {str(e)}")
+        logger.error("Error redoing: %s", e)
         return f"Error redoing: {str(e)}"
@@ -125,7 +125,7 @@ def validate_command(command_type: str, params: Dict[str, Any], raise_on_error:
         FileNotFoundError: If schema file not found
     """
     if not HAS_JSONSCHEMA:
-        logger.debug(f"Skipping validation for {command_type} (jsonschema not installed)")
+        logger.debug("Skipping validation for %s (jsonschema not installed)", command_type)
         return True
 
     schema_path = f"commands/{command_type}.json"
@@ -136,16 +136,16 @@ def validate_command(command_type: str, params: Dict[str, Any], raise_on_error:
         validator = Draft202012Validator(schema, registry=_get_registry())
         validator.validate(params)
 
-        logger.debug(f"Validation passed for {command_type}")
+        logger.debug("Validation passed for %s", command_type)
         return True
 
     except jsonschema.ValidationError as e:
-        logger.error(f"Validation failed for {command_type}: {e.message}")
+        logger.error("Validation failed for %s: %s", command_type, e.message)
         if raise_on_error:
             raise
         return False
     except FileNotFoundError:
-        logger.warning(f"No schema found for {command_type}, skipping validation")
+        logger.warning("No schema found for %s, skipping validation", command_type)
         return True
 
 
@@ -191,7 +191,7 @@ def validate_response(command_type: str, response: Dict[str, Any], raise_on_erro
 
     schema_name = response_schema_map.get(command_type)
     if not schema_name:
-        logger.debug(f"No response schema for {command_type}")
+        logger.debug("No response schema for %s", command_type)
         return True
 
     schema_path = f"responses/{schema_name}"
@@ -202,16 +202,16 @@ def validate_response(command_type: str, response: Dict[str, Any], raise_on_erro
         validator = Draft202012Validator(schema, registry=_get_registry())
         validator.validate(response)
 
-        logger.debug(f"Response validation passed for {command_type}")
+        logger.debug("Response validation passed for %s", command_type)
         return True
 
     except jsonschema.ValidationError as e:
-        logger.error(f"Response validation failed for {command_type}: {e.message}")
+        logger.error("Response validation failed for %s: %s", command_type, e.message)
         if raise_on_error:
             raise
         return False
     except FileNotFoundError:
-        logger.warning(f"No response schema found for {command_type}")
+        logger.warning("No response schema found for %s", command_type)
         return True
 
 
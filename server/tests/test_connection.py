@@ -53,6 +53,9 @@ class TestRhinoConnection:
         assert result is True
         assert conn.sock is not None
         mock_sock.connect.assert_called_once_with(("127.0.0.1", 1999))
+        mock_sock.setsockopt.assert_called_once_with(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
 
     @patch("socket.socket")
     def test_connect_failure(self, mock_socket_class):
@@ -210,6 +213,34 @@ class TestWireFraming:
         with pytest.raises(ConnectionError, match="mid-message"):
             conn.receive_full_response(mock_sock)
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @patch("socket.socket")
+    def test_wire_codec_round_trip(self, mock_socket_class, use_orjson):
+        """orjson is an optional codec; with or without it the frame carries
+        the same JSON, and non-string keys are stringified like json.dumps."""
+        import rhinomcp.server as srv
+
+        if use_orjson and srv.orjson is None:
+            pytest.skip("orjson not installed")
+
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+        response = {"status": "success", "result": {"name": "é", "id": "abc"}}
+        mock_sock.recv.side_effect = buffered_recv(
+            frame(json.dumps(response).encode("utf-8"))
+        )
+
+        with patch.object(srv, "orjson", srv.orjson if use_orjson else None):
+            conn = srv.RhinoConnection(host="127.0.0.1", port=1999)
+            conn.connect()
+            result = conn.send_command("get_objects", {"filters": {1: "x"}})
+
+        assert result == {"name": "é", "id": "abc"}
+        sent_data = mock_sock.sendall.call_args[0][0]
+        assert int.from_bytes(sent_data[:4], "big") == len(sent_data) - 4
+        sent = json.loads(sent_data[4:].decode("utf-8"))
+        assert sent == {"type": "get_objects", "params": {"filters": {"1": "x"}}}
+
 
 class TestRemoteBindingGate:
     """Non-loopback hosts require an explicit RHINO_MCP_ALLOW_REMOTE opt-in,
@@ -419,6 +450,21 @@ class TestResponseValidation:
             for r in caplog.records
         )
 
+    @patch("socket.socket")
+    def test_slow_command_is_logged_as_warning(self, mock_socket_class, caplog):
+        import rhinomcp.server as srv
+
+        conn = self._connect_with_response(mock_socket_class, {})
+
+        with patch.object(srv, "RHINO_SLOW_COMMAND_MS", 0):
+            with caplog.at_level("WARNING", logger="RhinoMCPServer"):
+                conn.send_command("get_document_summary", {})
+
+        assert any(
+            r.message.startswith("Slow command get_document_summary took")
+            for r in caplog.records
+        )
+
     @patch("socket.socket")
     def test_unmapped_command_skips_response_validation(self, mock_socket_class):
         """get_selected_objects_info returns {"selected_objects": [...]}, which
@@ -785,6 +831,33 @@ class TestSendCommand:
         assert "Please start Rhino" in str(exc.value)
         assert "127.0.0.1:1999" in str(exc.value)
 
+    @patch("socket.socket")
+    def test_get_rhino_connection_publishes_only_connected(self, mock_socket_class):
+        """The global must stay None while connecting and after a failed connect,
+        so the lock-free fast path never hands out an unconnected instance."""
+        import rhinomcp.server as server
+
+        seen_during_connect = []
+
+        def refuse(address):
+            seen_during_connect.append(server._rhino_connection)
+            raise ConnectionRefusedError("Connection refused")
+
+        mock_sock = MagicMock()
+        mock_sock.connect.side_effect = refuse
+        mock_socket_class.return_value = mock_sock
+
+        original_connection = server._rhino_connection
+        server._rhino_connection = None
+        try:
+            with pytest.raises(Exception, match="mcpstart"):
+                server.get_rhino_connection()
+            assert server._rhino_connection is None
+        finally:
+            server._rhino_connection = original_connection
+
+        assert seen_during_connect == [None]
+
 
 class TestEnvironmentConfig:
     """Tests for environment variable configuration."""
@@ -1107,6 +1107,17 @@ class TestSearchRhinoscriptFunctionsTool:
         assert isinstance(result, list)
         assert len(result) <= 3
 
+    def test_trigram_prefilter_matches_full_scan(self):
+        from rhinomcp.tools import rhinoscript_docs
+
+        query = "loft srf curves"
+        indexed = rhinoscript_docs._search_functions(query, limit=1000)
+        with patch.object(rhinoscript_docs, "_candidate_rows", return_value=None):
+            full_scan = rhinoscript_docs._search_functions(query, limit=1000)
+
+        assert indexed
+        assert indexed == full_scan
+
 
 class TestGetRhinoscriptDocsTool:
     """Tests for get_rhinoscript_docs tool."""
@@ -1138,6 +1149,15 @@ class TestGetRhinoscriptDocsTool:
         assert isinstance(result, dict)
         assert result.get("success") is False
 
+    def test_function_details_lookup_is_case_insensitive(self):
+        from rhinomcp.tools.rhinoscript_docs import _get_function_details
+
+        details = _get_function_details("addpoint")
+
+        assert details is not None
+        assert details["name"] == "AddPoint"
+        assert _get_function_details("NoSuchFunction123") is None
+
 
 class TestListRhinoscriptModulesTool:
     """Tests for list_rhinoscript_modules tool."""
@@ -1673,6 +1693,122 @@ class TestGrasshopperTools:
             {"graph_id": "TestGraph", "include_values": True, "max_items": 5},
         )
 
+    @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
+    def test_gh_get_available_components_forwards_offset(self, mock_get_conn):
+        from rhinomcp.tools.grasshopper_catalog import gh_get_available_components
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {"success": True}
+        mock_get_conn.return_value = mock_conn
+
+        gh_get_available_components(ctx=None, limit=100, offset=200)
+
+        mock_conn.send_command.assert_called_once_with(
+            "gh_get_available_components",
+            {"include_description": False, "limit": 100, "offset": 200},
+        )
+
+    @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
+    def test_gh_catalog_results_are_cached_per_socket(self, mock_get_conn):
+        from rhinomcp.tools.grasshopper_catalog import gh_batch_search_components
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {"results": {"Circle": None}}
+        mock_get_conn.return_value = mock_conn
+
+        first = gh_batch_search_components(ctx=None, queries=["Circle"], max_matches=3)
+        second = gh_batch_search_components(ctx=None, queries=["Circle"], max_matches=3)
+
+        assert first == second == {"results": {"Circle": None}}
+        mock_conn.send_command.assert_called_once()
+
+        # A reconnect swaps the socket; cached catalog answers must not outlive it.
+        mock_conn.sock = MagicMock()
+        gh_batch_search_components(ctx=None, queries=["Circle"], max_matches=3)
+        assert mock_conn.send_command.call_count == 2
+
+    @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
+    def test_gh_catalog_cache_hits_are_isolated_from_callers(self, mock_get_conn):
+        from rhinomcp.tools.grasshopper_catalog import gh_batch_search_components
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {"results": {"Circle": ["a"]}}
+        mock_get_conn.return_value = mock_conn
+
+        first = gh_batch_search_components(ctx=None, queries=["Circle"], max_matches=4)
+        first["results"]["Circle"].append("edited")
+        first["hint"] = "added by caller"
+
+        second = gh_batch_search_components(ctx=None, queries=["Circle"], max_matches=4)
+        second["results"].pop("Circle")
+
+        third = gh_batch_search_components(ctx=None, queries=["Circle"], max_matches=4)
+
+        mock_conn.send_command.assert_called_once()
+        assert second == {"results": {}}
+        assert third == {"results": {"Circle": ["a"]}}
+
+    @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
+    def test_gh_batch_search_sends_each_query_once(self, mock_get_conn):
+        from rhinomcp.tools.grasshopper_catalog import gh_batch_search_components
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {"results": {}}
+        mock_get_conn.return_value = mock_conn
+
+        gh_batch_search_components(
+            ctx=None, queries=["Panel", "Circle", "Panel", "circle"], max_matches=2
+        )
+
+        mock_conn.send_command.assert_called_once_with(
+            "gh_batch_search_components",
+            {"queries": ["Panel", "Circle", "circle"], "max_matches": 2},
+        )
+
+    @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
+    def test_gh_canvas_reads_are_not_cached(self, mock_get_conn):
+        from rhinomcp.tools.grasshopper_components import gh_list_components
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {"components": []}
+        mock_get_conn.return_value = mock_conn
+
+        gh_list_components(ctx=None, limit=7)
+        gh_list_components(ctx=None, limit=7)
+
+        assert mock_conn.send_command.call_count == 2
+
+    @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
+    def test_gh_tools_require_a_selector_before_sending(self, mock_get_conn):
+        from rhinomcp.tools.grasshopper_catalog import gh_get_component_type_info
+        from rhinomcp.tools.grasshopper_components import (
+            gh_add_component,
+            gh_delete_component,
+            gh_get_component_info,
+            gh_update_component,
+        )
+        from rhinomcp.tools.grasshopper_parameters import (
+            gh_get_parameter_value,
+            gh_set_parameter_value,
+        )
+
+        with pytest.raises(ValueError, match="either instance_id or nickname"):
+            gh_get_component_info(ctx=None)
+        with pytest.raises(ValueError, match="either instance_id or nickname"):
+            gh_delete_component(ctx=None)
+        with pytest.raises(ValueError, match="either instance_id or nickname"):
+            gh_update_component(ctx=None, new_nickname="Renamed")
+        with pytest.raises(ValueError, match="either instance_id or nickname"):
+            gh_get_parameter_value(ctx=None)
+        with pytest.raises(ValueError, match="either instance_id or nickname"):
+            gh_set_parameter_value(ctx=None, value=1.0)
+        with pytest.raises(ValueError, match="either name or guid"):
+            gh_get_component_type_info(ctx=None)
+        with pytest.raises(ValueError, match="either component_name or component_guid"):
+            gh_add_component(ctx=None, position=[0, 0])
+
+        mock_get_conn.assert_not_called()
+
     @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
     def test_gh_solution_tools(self, mock_get_conn):
         from rhinomcp.tools.grasshopper_solution import gh_expire_solution, gh_run_solution
@@ -1831,6 +1967,32 @@ class TestGrasshopperTools:
             },
         )
 
+    @pytest.mark.parametrize(
+        "components, message",
+        [
+            ([], "at least one component"),
+            ([{"component_name": "Addition"}], "requires an alias"),
+            ([{"alias": "add"}], "missing component_name"),
+            (
+                [
+                    {"alias": "add", "component_name": "Addition"},
+                    {"alias": "ADD", "component_name": "Addition"},
+                ],
+                "Duplicate",
+            ),
+        ],
+    )
+    @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
+    def test_gh_build_graph_rejects_bad_components_locally(
+        self, mock_get_conn, components, message
+    ):
+        from rhinomcp.tools.grasshopper_build import gh_build_graph
+
+        with pytest.raises(ValueError, match=message):
+            gh_build_graph(ctx=None, components=components)
+
+        mock_get_conn.assert_not_called()
+
     @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
     def test_gh_mutate_graph_tool(self, mock_get_conn):
         from rhinomcp.tools.grasshopper_mutation import gh_mutate_graph
@@ -2083,7 +2245,6 @@ class TestGrasshopperTools:
             "gh_set_parameter_value",
             {
                 "value": 7.5,
-                "input_index": 0,
                 "nickname": "Radius",
                 "input_name": "R",
                 "min": 0,
@@ -2093,7 +2254,31 @@ class TestGrasshopperTools:
         )
         assert calls[3][0] == (
             "gh_get_parameter_value",
-            {"output_index": 0, "max_items": 12, "instance_id": "circle-id", "output_name": "C"},
+            {"max_items": 12, "instance_id": "circle-id", "output_name": "C"},
+        )
+
+    @patch("rhinomcp.tools._grasshopper_common.get_rhino_connection")
+    def test_gh_parameter_tools_forward_non_default_index(self, mock_get_conn):
+        from rhinomcp.tools.grasshopper_parameters import (
+            gh_get_parameter_value,
+            gh_set_parameter_value,
+        )
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {"success": True}
+        mock_get_conn.return_value = mock_conn
+
+        gh_set_parameter_value(ctx=None, instance_id="abc", value=1, input_index=2)
+        gh_get_parameter_value(ctx=None, instance_id="abc", output_index=1)
+
+        calls = mock_conn.send_command.call_args_list
+        assert calls[0][0] == (
+            "gh_set_parameter_value",
+            {"value": 1, "input_index": 2, "instance_id": "abc"},
+        )
+        assert calls[1][0] == (
+            "gh_get_parameter_value",
+            {"max_items": 100, "output_index": 1, "instance_id": "abc"},
         )
 
 